@@ -6,6 +6,7 @@ import SeleniumLibrary
 import selenium.webdriver.remote.webelement as webelement
 import anytree
 import robot.libraries.BuiltIn as robot_built_in
+import robot.running.context as robot_context
 import robopom.model as model
 import robopom.component_loader as file_loader
 import robopom.constants as constants
@@ -71,13 +72,9 @@ class RobopomSeleniumPlugin(SeleniumLibrary.base.LibraryComponent):
 
     @staticmethod
     def is_robot_running() -> bool:
-        built_in = robot_built_in.BuiltIn()
-        try:
-            prev_log_level = built_in.set_log_level("NONE")
-            built_in.set_log_level(prev_log_level)
-        except robot_built_in.RobotNotRunningError:
-            return False
-        return True
+        # BuiltIn raises RobotNotRunningError exactly when there is no current execution context,
+        # so check it directly instead of changing (and restoring) the log level
+        return robot_context.EXECUTION_CONTEXTS.current is not None
 
     @staticmethod
     def remove_path_prefix(path: str) -> str:
@@ -104,6 +101,14 @@ class RobopomSeleniumPlugin(SeleniumLibrary.base.LibraryComponent):
             new_path = new_path.replace(root, "", 1)
         return new_path
 
+    def has_locator_strategy(self, locator: str) -> bool:
+        # Same prefix detection that SeleniumLibrary uses, looked up directly in the registered strategies
+        separator_indexes = [index for index in (locator.find(":"), locator.find("=")) if index != -1]
+        if len(separator_indexes) == 0:
+            return False
+        prefix = locator[:min(separator_indexes)].strip()
+        return prefix in getattr(self.element_finder, "_strategies", {})
+
     @property
     def robot_running(self) -> bool:
         if self._robot_running is None:
@@ -146,8 +151,10 @@ class RobopomSeleniumPlugin(SeleniumLibrary.base.LibraryComponent):
         if len(path_split) == 4:
             # 0 -> "", 1 -> Root, 2 -> Page -> 3 Possible short
             _, _, page, short = path_split
-            if self.exists_component_with_short(page, short):
+            try:
                 return self.get_component_with_short(page, short)
+            except anytree.search.CountError:
+                pass
 
         # Find component by path
         return self.resolver.get(self.root, path)
@@ -170,7 +177,16 @@ class RobopomSeleniumPlugin(SeleniumLibrary.base.LibraryComponent):
             page = self.get_component(page)
         if short is None:
             return page
-        return anytree.search.findall_by_attr(page, short, "short", mincount=1, maxcount=1)[0]
+        if not isinstance(page, model.PageObject):
+            # Page elements can also be added directly to the root
+            return anytree.search.findall_by_attr(page, short, "short", mincount=1, maxcount=1)[0]
+        found = page.components_with_short(short)
+        if len(found) != 1:
+            raise anytree.search.CountError(
+                f"Expecting 1 component with short '{short}' in page '{page.name}', but found {len(found)}.",
+                tuple(found),
+            )
+        return found[0]
 
     @SeleniumLibrary.base.keyword
     def path_locator_strategy(
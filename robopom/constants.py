@@ -10,11 +10,14 @@ YAML_EXT = [".yaml", ".yml"]
 # Default values
 PAGES_FILE = "robopom_pages.resource"
 VARIABLES_FILE = "robopom_variables.yaml"
+WAIT_POLL_INTERVAL = 0.2  # Same as SeleniumLibrary
+MIN_WAIT_TIMEOUT = WAIT_POLL_INTERVAL  # With a timeout of 0 SeleniumLibrary does not check at all
 
 # Conversions
-TRUE = [value.casefold() for value in ["True", "Yes"]],
+TRUE = [value.casefold() for value in ["True", "Yes"]]
 FALSE = [value.casefold() for value in ["False", "No"]]
-ALMOST_NONE = [None, {}, []]
+# Deprecated: kept for backwards compatibility only, robopom uses model.is_almost_none
+ALMOST_NONE = [None, {}, [], ()]
 
 # Roles
 ROLE_TEXT = "text"
@@ -1,19 +1,37 @@
 from __future__ import annotations
 import anytree
 import typing
+import types
+import operator
 import os
+import time
 import robot.libraries.BuiltIn as robot_built_in
 import robot.errors
+import robot.utils
+import robot.running.context as robot_context
 import SeleniumLibrary
+import selenium.common.exceptions as selenium_exceptions
 import robopom.RobopomSeleniumPlugin as robopom_selenium_plugin
 import robopom.constants as constants
 import robopom.component_loader as component_loader
 
 # T = typing.TypeVar('T', bound='Component')
 
+# Shared read-only defaults, so components without format arguments do not allocate their own empty containers
+EMPTY_FORMAT_ARGS: typing.Tuple[str, ...] = ()
+EMPTY_FORMAT_KWARGS: typing.Mapping[str, str] = types.MappingProxyType({})
+
+
+def is_almost_none(value: typing.Any) -> bool:
+    # None or an empty container (format arguments default to an empty tuple or mapping proxy)
+    return value is None or (isinstance(value, (dict, list, tuple, types.MappingProxyType)) and len(value) == 0)
+
 
 class Component(anytree.Node):
     separator = constants.SEPARATOR
+    # SeleniumLibrary instance found in a Robot Framework execution context: (context, selenium_library)
+    _selenium_library_cache: typing.Tuple[typing.Any, typing.Optional[SeleniumLibrary.SeleniumLibrary]] = (None, None)
+    _built_in: typing.Optional[robot_built_in.BuiltIn] = None
 
     def __init__(self,
                  name: str = None,
@@ -22,60 +40,132 @@ class Component(anytree.Node):
                  **kwargs) -> None:
         if name is None:
             name = str(id(self))
+        self._has_ancestor_auto_named: typing.Optional[bool] = None
+        self._absolute_path: typing.Optional[str] = None
+        self._path_locator: typing.Optional[str] = None
+        self._page_path: typing.Optional[str] = None
+        self._page: typing.Optional[PageObject] = None
+        self._name: typing.Optional[str] = None
+        self._auto_named = False
+        self._robopom_plugin: typing.Optional[robopom_selenium_plugin.RobopomSeleniumPlugin] = None
         super().__init__(name=name, parent=parent, children=children, **kwargs)
-        self._robopom_plugin = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        if value == self._name:
+            return
+        self._name = value
+        # Names are rarely numeric, so check digits first instead of catching int() ValueError
+        self._auto_named = isinstance(value, str) and value.isdecimal() and int(value) == id(self)
+        # This component and its descendants may have cached values that depend on this name
+        self._reset_tree_cache()
+
+    def _post_attach(self, parent: Component) -> None:
+        self._reset_tree_cache()
+        parent._reset_shorts_index()
+
+    def _post_detach(self, parent: Component) -> None:
+        self._reset_tree_cache()
+        parent._reset_shorts_index()
+
+    def _reset_tree_cache(self) -> None:
+        # Values cached from the ancestors of a component are no longer valid in the whole subtree
+        for component in anytree.PreOrderIter(self):
+            component._has_ancestor_auto_named = None
+            component._absolute_path = None
+            component._path_locator = None
+            component._page_path = None
+            component._page = None
+
+    def _reset_shorts_index(self) -> None:
+        # The page this component belongs to (if any) has to index its shorts again
+        component = self
+        while component is not None and not isinstance(component, PageObject):
+            component = component.parent
+        if component is not None:
+            component._shorts_index = None
 
     @property
     def auto_named(self) -> bool:
-        try:
-            if int(self.name) == id(self):
-                return True
-        except ValueError:
-            pass
-        return False
+        # Computed when the name is set
+        return self._auto_named
 
     @property
     def has_ancestor_auto_named(self) -> bool:
-        if self.parent is None:
-            return False
-        parent: Component = self.parent
-        if parent.auto_named or parent.has_ancestor_auto_named:
-            return True
-        return False
+        if self._has_ancestor_auto_named is None:
+            # Walk up until an auto named ancestor or an ancestor with an already known value is found
+            has_ancestor_auto_named = False
+            ancestor: typing.Optional[Component] = self.parent
+            while ancestor is not None:
+                if ancestor.auto_named:
+                    has_ancestor_auto_named = True
+                    break
+                if ancestor._has_ancestor_auto_named is not None:
+                    has_ancestor_auto_named = ancestor._has_ancestor_auto_named
+                    break
+                ancestor = ancestor.parent
+            self._has_ancestor_auto_named = has_ancestor_auto_named
+        return self._has_ancestor_auto_named
 
     @property
     def absolute_path(self) -> str:
-        if self.is_root:
-            path = f"{self.separator}{self.name}"
-        else:
-            path = f"{self.parent.absolute_path}{self.separator}{self.name}"
-        path = self.robopom_plugin.remove_separator_prefix(path)
-        path = self.robopom_plugin.remove_root_prefix(path)
-        path = self.robopom_plugin.remove_separator_prefix(path)
-        return path
+        if self._absolute_path is None:
+            sep = self.separator
+            if self.is_root:
+                path = f"{sep}{self.name}"
+            else:
+                path = f"{self.parent.absolute_path}{sep}{self.name}"
+            # Parent path is already normalized, so usually the prefixes do not need to be removed
+            if path.startswith(sep) or path.startswith(f"{constants.ROOT_NAME}{sep}"):
+                plugin_class = robopom_selenium_plugin.RobopomSeleniumPlugin
+                path = plugin_class.remove_separator_prefix(path)
+                path = plugin_class.remove_root_prefix(path)
+                path = plugin_class.remove_separator_prefix(path)
+            self._absolute_path = path
+        return self._absolute_path
 
     @property
     def built_in(self) -> robot_built_in.BuiltIn:
-        return robot_built_in.BuiltIn()
+        # BuiltIn works on the current execution context and keeps no state of its own, so one instance is shared
+        if Component._built_in is None:
+            Component._built_in = robot_built_in.BuiltIn()
+        return Component._built_in
 
     @property
     def selenium_library(self) -> typing.Optional[SeleniumLibrary.SeleniumLibrary]:
+        # Library instances do not change during an execution context (suite), so lookup is done once per context
+        context = robot_context.EXECUTION_CONTEXTS.current
+        if context is None:
+            return None
+        cached_context, cached_selenium_library = Component._selenium_library_cache
+        if cached_context is context:
+            return cached_selenium_library
         try:
-            return self.built_in.get_library_instance(constants.SELENIUM_LIBRARY_NAME)
+            selenium_library = self.built_in.get_library_instance(constants.SELENIUM_LIBRARY_NAME)
         except robot_built_in.RobotNotRunningError:
             return None
         except robot.errors.RobotError:
             return None
         except RuntimeError:
             return None
+        Component._selenium_library_cache = (context, selenium_library)
+        return selenium_library
 
     @property
     def robopom_plugin(self) -> typing.Optional[robopom_selenium_plugin.RobopomSeleniumPlugin]:
-        if self.selenium_library is None:
-            if getattr(self, "_robopom_plugin", None) is None:
-                self._robopom_plugin = robopom_selenium_plugin.RobopomSeleniumPlugin()
-            return self._robopom_plugin
-        return getattr(self.selenium_library, "robopom_plugin", None)
+        selenium_library = self.selenium_library
+        if selenium_library is None:
+            # Robot not running: one plugin is shared by the whole tree and kept in its root
+            # (creating a plugin searches the working dir for pages files)
+            root: Component = self.root
+            if root._robopom_plugin is None:
+                root._robopom_plugin = robopom_selenium_plugin.RobopomSeleniumPlugin()
+            return root._robopom_plugin
+        return getattr(selenium_library, "robopom_plugin", None)
 
     def add_child(self, child: Component):
         child.parent = self
@@ -86,26 +176,33 @@ class Component(anytree.Node):
             prev_dict = {}
 
         sep = self.separator
+        path_prefix = constants.PATH_PREFIX
+
+        # Explicit stack instead of recursion, carrying down whether the component has an auto named ancestor.
+        # Children are pushed reversed so they are visited in order.
+        stack: typing.List[typing.Tuple[Component, bool]] = [(self, self.has_ancestor_auto_named)]
+        while stack:
+            component, has_ancestor_auto_named = stack.pop()
+            tainted = has_ancestor_auto_named or component.auto_named
+
+            if not tainted:
+                # "name" key-value calculation
+                path = component.absolute_path
+                key = path.upper()
+                while key.startswith(sep):
+                    key = key[len(sep):]
+                prev_dict[key] = f"{path_prefix}:{path}"
+
+            # "short" key-value calculation
+            short: str = getattr(component, "short", None)
+            if short is not None:
+                page: PageObject = getattr(component, "page")
+                key = f"{page.name}{sep}{short}"
+                prev_dict[key.upper()] = f"{path_prefix}:{key}"
+
+            # children
+            stack.extend((child, tainted) for child in reversed(component.children))
 
-        if not self.auto_named and not self.has_ancestor_auto_named:
-            # "name" key-value calculation
-            path = self.absolute_path
-            key = path.upper()
-            while key.startswith(sep):
-                key = key[len(sep):]
-            prev_dict[key] = f"{constants.PATH_PREFIX}:{path}"
-
-        # "short" key-value calculation
-        short: str = getattr(self, "short", None)
-        if short is not None:
-            page: PageObject = getattr(self, "page")
-            key = f"{page.name}{sep}{short}"
-            prev_dict[key.upper()] = f"{constants.PATH_PREFIX}:{key}"
-
-        # children
-        children = getattr(self, "children", [])
-        for child in children:
-            prev_dict = child.variables_dictionary(prev_dict)
         prev_dict.pop("", None)
         return prev_dict
 
@@ -121,24 +218,91 @@ class RootComponent(Component):
 
 
 class PageComponent(Component):
+    _short: typing.Optional[str] = None
+
     def __init__(self,
                  name: str = None,
                  parent: AnyParent = None,
                  children: typing.Iterable[AnyPageElement] = None,
                  **kwargs, ) -> None:
+        self._selenium_locator_cache: typing.Optional[typing.Tuple[str, str]] = None
         super().__init__(name=name, parent=parent, children=children, **kwargs)
 
+    def __repr__(self) -> str:
+        # Same as anytree's repr, also showing short (stored in _short because it is a property)
+        args = [repr(self.separator.join([""] + [str(node.name) for node in self.path]))]
+        attributes = {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+        if "_short" in self.__dict__:
+            attributes["short"] = self._short
+        args.extend(f"{key}={value!r}" for key, value in sorted(attributes.items()))
+        return f"{self.__class__.__name__}({', '.join(args)})"
+
+    @property
+    def short(self) -> typing.Optional[str]:
+        return self._short
+
+    @short.setter
+    def short(self, value: typing.Optional[str]) -> None:
+        self._short = value
+        # The page indexes its components by short
+        self._reset_shorts_index()
+
+    def _selenium_locator(self, robopom_plugin: robopom_selenium_plugin.RobopomSeleniumPlugin) -> str:
+        # locator transformation: If strategy not explicitly set,
+        # xpath is used if locator is "." or starts with "./" or "/", css otherwise
+        locator: str = getattr(self, "locator")
+        cached = self._selenium_locator_cache
+        if cached is not None and cached[0] == locator:
+            return cached[1]
+        if robopom_plugin.has_locator_strategy(locator):
+            selenium_locator = locator
+        elif locator == "." or locator.startswith("/") or locator.startswith("./"):
+            selenium_locator = f"xpath:{locator}"
+        else:
+            selenium_locator = f"css:{locator}"
+        # Without ":" or "=" a locator can not have a strategy prefix, so the result does not depend
+        # on the strategies registered in SeleniumLibrary (that can change at runtime) and can be kept
+        if ":" not in locator and "=" not in locator:
+            self._selenium_locator_cache = (locator, selenium_locator)
+        return selenium_locator
+
+    def _html_parent_element(
+            self,
+            locator: str,
+            robopom_plugin: robopom_selenium_plugin.RobopomSeleniumPlugin,
+            required: bool,
+    ) -> typing.Tuple[bool, typing.Optional[SeleniumLibrary.locators.elementfinder.WebElement]]:
+        # Returns if html parent was found, and the web element where locator is searched (None to search the page)
+        if locator.startswith("xpath:/"):
+            # Do not mind html_parent
+            return True, None
+        html_parent = self.real_html_parent
+        if isinstance(html_parent, str):
+            parent_element = robopom_plugin.find_element(html_parent, required=required)
+        elif isinstance(html_parent, PageElement):
+            parent_element = html_parent.find_element(required=required)
+        else:
+            return True, None
+        return parent_element is not None, parent_element
+
     def wait_until_loaded(self, timeout=None) -> None:
         self._wait_until_loaded(timeout, force=True)
 
     def _wait_until_loaded(self, timeout=None, force: bool = False) -> None:
-        if isinstance(self, (PageElement, PageElements)):
-            if self.always_visible or force:
-                self.wait_until_visible(timeout)
-        if not self.is_leaf:
-            for e in self.children:
-                e: PageComponent
-                e._wait_until_loaded(timeout)
+        # Explicit stack instead of recursion. Children are pushed reversed so they are visited in order.
+        stack: typing.List[typing.Tuple[PageComponent, bool]] = [(self, force)]
+        # The whole component has to be loaded within timeout, so each wait only gets the time still left
+        # (but always enough to check the element at least once)
+        deadline = None
+        while stack:
+            component, component_force = stack.pop()
+            if isinstance(component, (PageElement, PageElements)):
+                if component.always_visible or component_force:
+                    if deadline is None:
+                        deadline = time.time() + self.robopom_plugin.get_timeout(timeout)
+                    component.wait_until_visible(max(deadline - time.time(), constants.MIN_WAIT_TIMEOUT))
+            if not component.is_leaf:
+                stack.extend((child, False) for child in reversed(component.children))
 
     @property
     def real_html_parent(self) -> typing.Union[None, PageElement, str]:
@@ -151,10 +315,13 @@ class PageComponent(Component):
 
     @property
     def page(self) -> PageObject:
-        if isinstance(self, PageObject):
-            return self
-        else:
-            return self.parent.page
+        if self._page is None:
+            # Walk up the ancestors until the page object or an ancestor with an already known page is found
+            component = self
+            while not isinstance(component, PageObject) and component._page is None:
+                component = component.parent
+            self._page = component if isinstance(component, PageObject) else component._page
+        return self._page
 
 
 class PageObject(PageComponent):
@@ -162,8 +329,21 @@ class PageObject(PageComponent):
                  name: str,
                  parent: RootComponent = None,
                  children: typing.Iterable[AnyPageElement] = None, ) -> None:
+        self._shorts_index: typing.Optional[typing.Dict[str, typing.List[PageComponent]]] = None
         super().__init__(name=name, parent=parent, children=children)
 
+    def components_with_short(self, short: str) -> typing.List[PageComponent]:
+        # Index is built on first use and reset when a short changes or components are attached to or detached
+        # from the page
+        if self._shorts_index is None:
+            shorts_index: typing.Dict[str, typing.List[PageComponent]] = {}
+            for component in anytree.PreOrderIter(self):
+                component_short = getattr(component, "short", None)
+                if component_short is not None:
+                    shorts_index.setdefault(component_short, []).append(component)
+            self._shorts_index = shorts_index
+        return self._shorts_index.get(short, [])
+
 
 class PageElement(PageComponent):
 
@@ -179,15 +359,7 @@ class PageElement(PageComponent):
                  children: typing.Iterable[AnyPageElement] = None,
                  default_role: str = None,
                  prefer_visible: bool = True, ):
-        super().__init__(name=name,
-                         locator=locator,
-                         parent=parent,
-                         short=short,
-                         always_visible=always_visible,
-                         html_parent=html_parent,
-                         order=order,
-                         children=children,
-                         prefer_visible=prefer_visible, )
+        # Set before attaching to parent
         self.locator = locator
         self.short = short
         self.always_visible = always_visible
@@ -195,41 +367,26 @@ class PageElement(PageComponent):
         self.order = order
         self.default_role = default_role
         self.prefer_visible = prefer_visible
+        super().__init__(name=name, parent=parent, children=children)
 
     def find_element(self, required: bool = True) -> typing.Optional[SeleniumLibrary.locators.elementfinder.WebElement]:
-        assert self.robopom_plugin is not None, \
-            f"find_element: self.robopom_plugin should not be None"
-        # locator transformation: If strategy not explicitly set,
-        # xpath is used if locator is "." or starts with "./" or "/", css otherwise
-        strategies = getattr(self.robopom_plugin.element_finder, "_strategies", [])
-        for strategy in strategies:
-            if self.locator.startswith(strategy):
-                locator = self.locator
-                break
-        else:
-            if self.locator == "." or self.locator.startswith("/") or self.locator.startswith("./"):
-                locator = f"xpath:{self.locator}"
-            else:
-                locator = f"css:{self.locator}"
-
-        if locator.startswith("xpath:/"):
-            # Do not mind html_parent
-            parent_element = None
-        elif isinstance(self.real_html_parent, str):
-            parent_element = self.robopom_plugin.find_element(self.real_html_parent, required=required)
-            if parent_element is None:
-                return None
-        elif isinstance(self.real_html_parent, PageElement):
-            parent_element = self.real_html_parent.find_element(required=required)
-            if parent_element is None:
-                return None
-        else:
-            parent_element = None
+        robopom_plugin = self.robopom_plugin
+        assert robopom_plugin is not None, f"find_element: self.robopom_plugin should not be None"
+        locator = self._selenium_locator(robopom_plugin)
+        parent_found, parent_element = self._html_parent_element(locator, robopom_plugin, required)
+        if not parent_found:
+            return None
 
-        element = self.robopom_plugin.find_element(locator, required=required, parent=parent_element)
         if self.prefer_visible is False and self.order is None:
-            return element
-        elements = self.robopom_plugin.find_elements(locator, parent=parent_element)
+            return robopom_plugin.find_element(locator, required=required, parent=parent_element)
+
+        # A single find_elements query is enough to pick the element
+        elements = robopom_plugin.find_elements(locator, parent=parent_element)
+        if len(elements) == 0:
+            if required:
+                # Let SeleniumLibrary generate its usual "not found" error (or return the element if it just appeared)
+                return robopom_plugin.find_element(locator, required=True, parent=parent_element)
+            return None
         if self.order is not None:
             return elements[self.order]
         else:
@@ -237,41 +394,49 @@ class PageElement(PageComponent):
                 if e.is_displayed():
                     return e
             else:
-                return element
+                return elements[0]
 
     @property
     def status(self) -> PageElementStatus:
         element = self.find_element(required=False)
         if element is None:
-            return PageElementStatus(present=False)
+            return ABSENT_PAGE_ELEMENT_STATUS
         else:
             return PageElementStatus(present=True,
                                      visible=element.is_displayed(),
                                      enabled=element.is_enabled(),
                                      selected=element.is_selected(), )
 
+    # Single checks only ask the browser for the state they need, instead of building the whole status
     def is_present(self) -> bool:
-        return self.status.present
+        return self.find_element(required=False) is not None
 
     def is_visible(self) -> bool:
-        return self.status.visible
+        element = self.find_element(required=False)
+        return element is not None and element.is_displayed()
 
     def is_enabled(self) -> bool:
-        return self.status.enabled
+        element = self.find_element(required=False)
+        return element is not None and element.is_enabled()
 
     def is_selected(self) -> bool:
-        return self.status.selected
+        element = self.find_element(required=False)
+        return element is not None and element.is_selected()
 
     @property
     def page_path(self) -> str:
-        if isinstance(self.parent, PageObject):
-            return self.name
-        else:
-            return f"{self.parent.page_path}{self.separator}{self.name}"
+        if self._page_path is None:
+            if isinstance(self.parent, PageObject):
+                self._page_path = self.name
+            else:
+                self._page_path = f"{self.parent.page_path}{self.separator}{self.name}"
+        return self._page_path
     
     @property
     def path_locator(self) -> str:
-        return f"{constants.PATH_PREFIX}:{self.absolute_path}"
+        if self._path_locator is None:
+            self._path_locator = f"{constants.PATH_PREFIX}:{self.absolute_path}"
+        return self._path_locator
 
     @property
     def tag_name(self) -> typing.Optional[str]:
@@ -292,29 +457,52 @@ class PageElement(PageComponent):
         assert self.robopom_plugin is not None, \
             f"wait_until_visible: self.robopom_plugin should not be None"
         SeleniumLibrary.WaitingKeywords(self.selenium_library).wait_until_element_is_visible(
-            f"{constants.PATH_PREFIX}:{self.absolute_path}",
+            self.path_locator,
             timeout=timeout,
             # error=f"Element {self} not visible after {timeout}",
         )
 
 
 class PageElementStatus:
+    __slots__ = ("present", "visible", "enabled", "selected")
+
     def __init__(self,
                  present: typing.Optional[bool] = None,
                  visible: typing.Optional[bool] = None,
                  enabled: typing.Optional[bool] = None,
                  selected: typing.Optional[bool] = None, ) -> None:
-        self.present = present
-        self.visible = visible
-        self.enabled = enabled
-        self.selected = selected
         # Apply restrictions
-        if self.visible or self.enabled or self.selected:
-            self.present = True
-        if self.present is False:
-            self.visible = False
-            self.enabled = False
-            self.selected = False
+        if visible or enabled or selected:
+            present = True
+        if present is False:
+            visible = False
+            enabled = False
+            selected = False
+        # Immutable, so values are set bypassing __setattr__
+        object.__setattr__(self, "present", present)
+        object.__setattr__(self, "visible", visible)
+        object.__setattr__(self, "enabled", enabled)
+        object.__setattr__(self, "selected", selected)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"PageElementStatus is immutable, can not set '{name}'")
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, PageElementStatus):
+            return NotImplemented
+        return (self.present, self.visible, self.enabled, self.selected) == \
+               (other.present, other.visible, other.enabled, other.selected)
+
+    def __hash__(self) -> int:
+        return hash((self.present, self.visible, self.enabled, self.selected))
+
+    def __repr__(self) -> str:
+        return f"PageElementStatus(present={self.present!r}, visible={self.visible!r}, " \
+               f"enabled={self.enabled!r}, selected={self.selected!r})"
+
+
+# Status is immutable, so every absent element can share the same one
+ABSENT_PAGE_ELEMENT_STATUS = PageElementStatus(present=False)
 
 
 class PageElements(PageComponent):
@@ -331,89 +519,85 @@ class PageElements(PageComponent):
             default_role: str = None,
     ) -> None:
 
-        super().__init__(name=name,
-                         locator=locator,
-                         parent=parent,
-                         short=short,
-                         always_visible=always_visible,
-                         html_parent=html_parent, )
         self.locator = locator
         self.short = short
         self.always_visible = always_visible
         self.html_parent = html_parent
         self.default_role = default_role
         self._previous_page_elements: typing.List[PageElement] = []
+        super().__init__(name=name, parent=parent)
 
     def find_elements(self) -> typing.List[SeleniumLibrary.locators.elementfinder.WebElement]:
-        assert self.robopom_plugin is not None, \
-            f"find_element: self.robopom_plugin should not be None"
-        # locator transformation: If strategy not explicitly set,
-        # xpath is used if locator is "." or starts with "./" or "/", css otherwise
-        strategies = getattr(self.robopom_plugin.element_finder, "_strategies", [])
-        for strategy in strategies:
-            if self.locator.startswith(strategy):
-                locator = self.locator
-                break
-        else:
-            if self.locator == "." or self.locator.startswith("/") or self.locator.startswith("./"):
-                locator = f"xpath:{self.locator}"
-            else:
-                locator = f"css:{self.locator}"
-
-        if locator.startswith("xpath:/"):
-            # Do not mind html_parent
-            parent_element = None
-        elif isinstance(self.real_html_parent, str):
-            parent_element = self.robopom_plugin.find_element(self.real_html_parent, required=False)
-            if parent_element is None:
-                return []
-        elif isinstance(self.real_html_parent, PageElement):
-            parent_element = self.real_html_parent.find_element(required=False)
-            if parent_element is None:
-                return []
-        else:
-            parent_element = None
-
-        elements = self.robopom_plugin.find_elements(locator, parent=parent_element)
+        robopom_plugin = self.robopom_plugin
+        assert robopom_plugin is not None, f"find_element: self.robopom_plugin should not be None"
+        locator = self._selenium_locator(robopom_plugin)
+        parent_found, parent_element = self._html_parent_element(locator, robopom_plugin, required=False)
+        if not parent_found:
+            return []
+
+        elements = robopom_plugin.find_elements(locator, parent=parent_element)
         return elements
 
     @property
     def page_elements(self) -> typing.List[PageElement]:
-        # Remove from pom previous page elements:
-        for e in self._previous_page_elements:
-            e.parent = None
-
         num = len(self.find_elements())
+        previous_page_elements = self._previous_page_elements
         page_elements = []
         for i in range(num):
+            name = f"{self.name}_{i}"
+            short = f"{self.short}_{i}" if self.short is not None else None
+            # Reuse the page element of the previous call if it is still in the pom tree and it is the same
+            previous = previous_page_elements[i] if i < len(previous_page_elements) else None
+            if previous is not None \
+                    and previous.parent is self.parent \
+                    and previous.name == name \
+                    and previous.order == i \
+                    and previous.short == short \
+                    and previous.locator == self.locator \
+                    and previous.html_parent == self.html_parent \
+                    and previous.default_role == self.default_role:
+                page_elements.append(previous)
+                continue
+            if previous is not None:
+                previous.parent = None
             page_elements.append(PageElement(
                 locator=self.locator,
-                name=f"{self.name}_{i}",
+                name=name,
                 parent=self.parent,
-                short=f"self.short_{i}" if self.short is not None else None,
+                short=short,
                 html_parent=self.html_parent,
                 order=i,
                 default_role=self.default_role,
                 prefer_visible=False,
             ))
 
+        # Remove from pom previous page elements that are not used any more
+        for e in previous_page_elements[num:]:
+            e.parent = None
+
         # Store page elements
         self._previous_page_elements = page_elements
 
         return page_elements
 
     def wait_until_visible(self, timeout=None) -> None:
-        assert self.robopom_plugin is not None, \
+        robopom_plugin = self.robopom_plugin
+        assert robopom_plugin is not None, \
             f"PageElements.wait_until_visible: self.robopom_plugin should not be None"
-        pe = PageElement(
-                locator=self.locator,
-                parent=self.parent,
-                html_parent=self.html_parent,
-                default_role=self.default_role,
-            )
-        pe.wait_until_visible(timeout)
-        # remove pe from pom tree
-        pe.parent = None
+        # Wait until any of the elements is visible, without adding a temporary PageElement to the pom tree
+        timeout = robopom_plugin.get_timeout(timeout)
+        max_time = time.time() + timeout
+        while True:
+            try:
+                if any(element.is_displayed() for element in self.find_elements()):
+                    return
+            except selenium_exceptions.StaleElementReferenceException:
+                # Page changed while checking, try again
+                pass
+            if time.time() >= max_time:
+                raise AssertionError(f"Element '{constants.PATH_PREFIX}:{self.absolute_path}' "
+                                     f"not visible after {robot.utils.secs_to_timestr(timeout)}.")
+            time.sleep(constants.WAIT_POLL_INTERVAL)
 
 
 class PageElementGenerator(PageComponent):
@@ -429,14 +613,6 @@ class PageElementGenerator(PageComponent):
                  order: int = None,
                  default_role: str = None,
                  prefer_visible: bool = True, ):
-        super().__init__(name=name,
-                         locator_generator=locator_generator,
-                         parent=parent,
-                         short=short,
-                         always_visible=always_visible,
-                         html_parent=html_parent,
-                         order=order,
-                         prefer_visible=prefer_visible, )
         self.locator_generator = locator_generator
         self.short = short
         self.always_visible = always_visible
@@ -444,6 +620,9 @@ class PageElementGenerator(PageComponent):
         self.order = order
         self.default_role = default_role
         self.prefer_visible = prefer_visible
+        # Auto named instances used as parents of child generator instances: {(id(parent), locator): instance}
+        self._parent_instances: typing.Dict[typing.Tuple[int, str], PageElementGeneratorInstance] = {}
+        super().__init__(name=name, parent=parent)
         
     def child_generator(self,
                         name: str = None,
@@ -503,6 +682,22 @@ class PageElementGenerator(PageComponent):
             prefer_visible=prefer_visible,
         )
 
+    def _parent_instance_with(self,
+                              format_args: typing.List[str],
+                              format_kwargs: typing.Dict[str, str]) -> PageElementGeneratorInstance:
+        # Reuse the instance created for the same parent and locator while it is still in the pom tree,
+        # instead of adding a new chain of parent instances for each child generator instance
+        if isinstance(self.parent, PageElementGenerator):
+            parent = self.parent._parent_instance_with(format_args, format_kwargs)
+        else:
+            parent = self.parent
+        key = (id(parent), self.locator_generator.format(*format_args, **format_kwargs))
+        instance = self._parent_instances.get(key)
+        if instance is None or instance.parent is not parent:
+            instance = self.page_element_with(format_args=format_args, format_kwargs=format_kwargs)
+            self._parent_instances[key] = instance
+        return instance
+
 
 class PageElementGeneratorInstance(PageElement):
     def __init__(self,
@@ -519,15 +714,15 @@ class PageElementGeneratorInstance(PageElement):
                  prefer_visible: bool = None, ):
         
         if format_args is None:
-            format_args = []
+            format_args = EMPTY_FORMAT_ARGS
         if format_kwargs is None:
-            format_kwargs = {}
+            format_kwargs = EMPTY_FORMAT_KWARGS
 
         # name and short are not inherited.
 
         locator = generator.locator_generator.format(*format_args, **format_kwargs)
         if isinstance(generator.parent, PageElementGenerator):
-            parent = generator.parent.page_element_with(format_args=format_args, format_kwargs=format_kwargs)
+            parent = generator.parent._parent_instance_with(format_args, format_kwargs)
         else:
             parent = generator.parent
         if always_visible is None:
@@ -551,14 +746,6 @@ class PageElementGeneratorInstance(PageElement):
             default_role=default_role,
             prefer_visible=prefer_visible,
         )
-        self.locator = locator
-        self.short = short
-        self.always_visible = always_visible
-        self.html_parent = html_parent
-        self.order = order
-        self.default_role = default_role
-        self.prefer_visible = prefer_visible
-
         self.generator = generator
         self.format_args = format_args
         self.format_kwargs = format_kwargs
@@ -566,10 +753,11 @@ class PageElementGeneratorInstance(PageElement):
 
 class PageElementFrame(PageElement):
     def wait_until_loaded(self, timeout=None) -> None:
-        prev_frame = self.robopom_plugin.get_current_frame()
+        robopom_plugin = self.robopom_plugin
+        prev_frame = robopom_plugin.get_current_frame()
         SeleniumLibrary.FrameKeywords(self.selenium_library).select_frame(self.path_locator)
         super().wait_until_loaded(timeout=timeout)
-        self.robopom_plugin.driver.switch_to.frame(prev_frame)
+        robopom_plugin.driver.switch_to.frame(prev_frame)
 
 
 class GenericComponent(Component):
@@ -587,7 +775,8 @@ class GenericComponent(Component):
     #     import_file=["PageElement", "PageElements", "PageElementGenerator", "PageElementGeneratorInstance"],
     #     import_path=["PageElement", "PageElements", "PageElementGenerator", "PageElementGeneratorInstance"],
     # )
-    page_components_props = [
+    # Only used for membership tests
+    page_components_props = frozenset((
         "locator",
         "locator_generator",
         "short",
@@ -597,8 +786,44 @@ class GenericComponent(Component):
         "default_role",
         "prefer_visible",
         "format_args",
-        "format_kwargs"
-    ]
+        "format_kwargs",
+    ))
+    # Properties returned by kwargs (in this order)
+    kwargs_props = (
+        "component_type",
+        "locator",
+        "locator_generator",
+        "short",
+        "always_visible",
+        "html_parent",
+        "order",
+        "default_role",
+        "prefer_visible",
+        "generator",
+        "format_args",
+        "format_kwargs",
+        "import_file",
+        "import_path",
+    )
+    _kwargs_getter = operator.attrgetter(*kwargs_props)
+    # Properties that take the value of the imported component if they are None
+    imported_props = (
+        "component_type",
+        "locator",
+        "locator_generator",
+        "short",
+        "always_visible",
+        "html_parent",
+        "order",
+        "default_role",
+        "prefer_visible",
+        "generator",
+    )
+    # Properties that take the value of the imported component if they are empty
+    imported_if_empty_props = (
+        "format_args",
+        "format_kwargs",
+    )
 
     def __init__(self,
                  name: str = None,
@@ -637,16 +862,10 @@ class GenericComponent(Component):
         )
 
         if format_args is None:
-            format_args = []
+            format_args = EMPTY_FORMAT_ARGS
         if format_kwargs is None:
-            format_kwargs = {}
+            format_kwargs = EMPTY_FORMAT_KWARGS
 
-        super().__init__(
-            name=name,
-            parent=parent,
-            children=children,
-            **kwargs,
-        )
         self.component_type = component_type
         self.locator = locator
         self.locator_generator = locator_generator
@@ -661,13 +880,17 @@ class GenericComponent(Component):
         self.format_kwargs = format_kwargs
         self.import_file = import_file
         self.import_path = import_path
+        super().__init__(name=name, parent=parent, children=children)
 
-        self.not_none_initial_kwargs = {
-            key: value for key, value in kwargs.items() if value not in constants.ALMOST_NONE
-        }
-        self.not_none_initial_page_component_kwargs = {
-            key: value for key, value in self.not_none_initial_kwargs.items() if key in self.page_components_props
-        }
+        # Both dictionaries in a single pass
+        self.not_none_initial_kwargs = {}
+        self.not_none_initial_page_component_kwargs = {}
+        for key, value in kwargs.items():
+            if is_almost_none(value):
+                continue
+            self.not_none_initial_kwargs[key] = value
+            if key in self.page_components_props:
+                self.not_none_initial_page_component_kwargs[key] = value
 
         # Import validations
         if self.import_file is not None:
@@ -688,64 +911,64 @@ class GenericComponent(Component):
 
     @property
     def kwargs(self) -> dict:
-        return dict(
-            component_type=self.component_type,
-            locator=self.locator,
-            locator_generator=self.locator_generator,
-            short=self.short,
-            always_visible=self.always_visible,
-            html_parent=self.html_parent,
-            order=self.order,
-            default_role=self.default_role,
-            prefer_visible=self.prefer_visible,
-            generator=self.generator,
-            format_args=self.format_args,
-            format_kwargs=self.format_kwargs,
-            import_file=self.import_file,
-            import_path=self.import_path,
-        )
+        return dict(zip(self.kwargs_props, self._kwargs_getter(self)))
+
+    def _not_none_values(self, props: typing.Iterable[str]) -> dict:
+        # Read straight from the fields, without building the intermediate kwargs dictionaries
+        not_none_values = {}
+        for prop in props:
+            value = getattr(self, prop)
+            if not is_almost_none(value):
+                not_none_values[prop] = value
+        return not_none_values
 
     @property
     def not_none_kwargs(self) -> dict:
-        return {
-            key: value for key, value in self.kwargs.items() if value not in constants.ALMOST_NONE}
+        return self._not_none_values(self.kwargs_props)
 
     @property
     def not_none_page_component_kwargs(self) -> dict:
-        return {
-            key: value for key, value in self.not_none_kwargs.items() if key in self.page_components_props
-        }
+        return self._not_none_values(prop for prop in self.kwargs_props if prop in self.page_components_props)
 
     def update_with_imported(self, imported: GenericComponent) -> None:
+        # Explicit stack of (component, imported) pairs instead of recursion
+        stack: typing.List[typing.Tuple[GenericComponent, GenericComponent]] = [(self, imported)]
+        while stack:
+            component, component_imported = stack.pop()
+            stack.extend(reversed(component._update_with_imported(component_imported)))
+
+    def _update_with_imported(
+            self,
+            imported: GenericComponent,
+    ) -> typing.List[typing.Tuple[GenericComponent, GenericComponent]]:
+        # Updates this component only. Returns the (child, imported_child) pairs that still have to be updated
         imported.guess_component_type()
 
         self.name = imported.name if self.name is None else self.name
         if len(self.children) == 0 and len(imported.children) > 0:
             self.children = imported.children
-        self.component_type = imported.component_type if self.component_type is None else self.component_type
-        self.locator = imported.locator if self.locator is None else self.locator
-        self.locator_generator = imported.locator_generator if self.locator_generator is None \
-            else self.locator_generator
-        self.short = imported.short if self.short is None else self.short
-        self.always_visible = imported.always_visible if self.always_visible is None else self.always_visible
-        self.html_parent = imported.html_parent if self.html_parent is None else self.html_parent
-        self.order = imported.order if self.order is None else self.order
-        self.default_role = imported.default_role if self.default_role is None else self.default_role
-        self.prefer_visible = imported.prefer_visible if self.prefer_visible is None else self.prefer_visible
-        self.generator = imported.generator if self.generator is None else self.generator
-        self.format_args = imported.format_args if len(self.format_args) == 0 else self.format_args
-        self.format_kwargs = imported.format_kwargs if len(self.format_kwargs) == 0 else self.format_kwargs
+        for prop in self.imported_props:
+            if getattr(self, prop) is None:
+                setattr(self, prop, getattr(imported, prop))
+        for prop in self.imported_if_empty_props:
+            if len(getattr(self, prop)) == 0:
+                setattr(self, prop, getattr(imported, prop))
 
         # self.guess_component_type()
 
-        # Children
+        # Children (index by name once, instead of scanning own children for each imported child)
+        pending = []
+        children_by_name = {}
+        for child in self.children:
+            children_by_name.setdefault(child.name, child)
         for imported_child in imported.children:
-            for child in self.children:
-                if imported_child.name == child.name:
-                    child.update_with_imported(imported_child)
-                    break
+            child = children_by_name.get(imported_child.name)
+            if child is not None:
+                pending.append((child, imported_child))
             else:
                 imported_child.parent = self
+                children_by_name[imported_child.name] = imported_child
+        return pending
 
     def guess_component_type(self):
         if self.component_type is None:
@@ -760,36 +983,45 @@ class GenericComponent(Component):
                 self.component_type = "PageElement"
 
     def get_component_type_instance(self, parent: PageComponent = None) -> PageComponent:
-        # Create a new instance, with children
+        # Create a new instance, with children.
+        # Explicit stack instead of recursion. Children are pushed reversed so they are created in order
+        # (a generator has to be created before its instances).
+        new_instance = self._new_component_type_instance(parent)
+        # Children of the new instances by name, so generators are found without scanning siblings
+        children_by_name: typing.Dict[int, typing.Dict[str, PageComponent]] = {id(new_instance): {}}
+        stack: typing.List[typing.Tuple[GenericComponent, PageComponent]] = [
+            (child, new_instance) for child in reversed(self.children)
+        ]
+        while stack:
+            component, component_parent = stack.pop()
+            siblings_by_name = children_by_name[id(component_parent)]
+            component_instance = component._new_component_type_instance(component_parent, siblings_by_name)
+            siblings_by_name.setdefault(component_instance.name, component_instance)
+            children_by_name[id(component_instance)] = {}
+            stack.extend((child, component_instance) for child in reversed(component.children))
+        return new_instance
+
+    def _new_component_type_instance(
+            self,
+            parent: PageComponent = None,
+            siblings_by_name: typing.Dict[str, PageComponent] = None,
+    ) -> PageComponent:
+        # Create a new instance, without children
         name = None if self.auto_named else self.name
-        if self.component_type.casefold() == "PageObject".casefold():
+        component_type = self.component_type.casefold()
+        if component_type == PAGE_OBJECT_TYPE:
             new_instance = PageObject(
                 name=name,
                 parent=parent,
             )
             assert len(self.not_none_initial_page_component_kwargs) == 0, \
                 f"PageObject should not define: {self.not_none_kwargs}"
-        elif self.component_type.casefold() == "PageElement".casefold():
-            new_instance = PageElement(
-                name=name,
-                parent=parent,
-                **self.not_none_page_component_kwargs,
-            )
-        elif self.component_type.casefold() == "PageElements".casefold():
-            new_instance = PageElements(
-                name=name,
-                parent=parent,
-                **self.not_none_page_component_kwargs,
-            )
-        elif self.component_type.casefold() == "PageElementGenerator".casefold():
-            new_instance = PageElementGenerator(
-                name=name,
-                parent=parent,
-                **self.not_none_page_component_kwargs,
-            )
-        elif self.component_type.casefold() == "PageElementGeneratorInstance".casefold():
+        elif component_type == PAGE_ELEMENT_GENERATOR_INSTANCE_TYPE:
             # Find generator
-            generator = [possible for possible in parent.children if possible.name == self.generator][0]
+            if siblings_by_name is not None:
+                generator = siblings_by_name.get(self.generator)
+            else:
+                generator = next((possible for possible in parent.children if possible.name == self.generator), None)
             assert isinstance(generator, PageElementGenerator), \
                 f"generator should be a PageElementGenerator, but it is a {type(generator)}"
             new_instance = PageElementGeneratorInstance(
@@ -797,21 +1029,27 @@ class GenericComponent(Component):
                 name=name,
                 **self.not_none_page_component_kwargs,
             )
-        elif self.component_type.casefold() == "PageElementFrame".casefold():
-            new_instance = PageElementFrame(
+        else:
+            component_class = PAGE_ELEMENT_TYPES.get(component_type)
+            assert component_class is not None, f"Component type not defined: {self.component_type}"
+            new_instance = component_class(
                 name=name,
                 parent=parent,
                 **self.not_none_page_component_kwargs,
             )
-        else:
-            assert False, f"Component type not defined: {self.component_type}"
 
-        for child in self.children:
-            child: GenericComponent
-            child.get_component_type_instance(parent=new_instance)
         return new_instance
 
 
+# Component types (casefolded) used in GenericComponent.get_component_type_instance
+PAGE_OBJECT_TYPE = "PageObject".casefold()
+PAGE_ELEMENT_GENERATOR_INSTANCE_TYPE = "PageElementGeneratorInstance".casefold()
+# Types created with name, parent and page component kwargs
+PAGE_ELEMENT_TYPES: typing.Dict[str, typing.Type[PageComponent]] = {
+    component_class.__name__.casefold(): component_class
+    for component_class in [PageElement, PageElements, PageElementGenerator, PageElementFrame]
+}
+
 # Type aliases
 AnyPageElement = typing.Union[PageElement, PageElements, PageElementGenerator]
 AnyConcretePageElement = typing.Union[PageElement, PageElements]